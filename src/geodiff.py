@@ -1,7 +1,12 @@
 """GeoDiff - Core logic for geospatial file comparison using pygeodiff."""
 
+import functools
 import json
+import os
+import shutil
 import tempfile
+from collections import defaultdict
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -15,7 +20,25 @@ class GeoDiffError(Exception):
 
 
 # Supported file extensions
-SUPPORTED_EXTENSIONS = {".gpkg", ".sqlite", ".db"}
+SUPPORTED_EXTENSIONS = frozenset({".gpkg", ".sqlite", ".db"})
+
+# Changeset operation codes mapped to change types
+_OP_TYPES = {
+    pygeodiff.ChangesetEntry.OP_INSERT: "insert",
+    pygeodiff.ChangesetEntry.OP_UPDATE: "update",
+    pygeodiff.ChangesetEntry.OP_DELETE: "delete",
+}
+
+
+@functools.cache
+def _get_geodiff() -> pygeodiff.GeoDiff:
+    """
+    Return the shared pygeodiff.GeoDiff instance.
+
+    The native library is loaded lazily on first use, so a single instance is
+    reused for every operation instead of being re-initialised per call.
+    """
+    return pygeodiff.GeoDiff()
 
 
 def validate_file(file_path: str) -> Path:
@@ -31,17 +54,32 @@ def validate_file(file_path: str) -> Path:
     Raises:
         GeoDiffError: If the file doesn't exist or has unsupported extension.
     """
-    path = Path(file_path)
-
-    if not path.exists():
-        raise GeoDiffError(f"File not found: {file_path}")
+    try:
+        os.stat(file_path)
+    except OSError:
+        raise GeoDiffError(f"File not found: {file_path}") from None
 
-    if path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+    suffix = os.path.splitext(file_path)[1]
+    if suffix.lower() not in SUPPORTED_EXTENSIONS:
         raise GeoDiffError(
-            f"Unsupported file format: {path.suffix}. Supported formats: {', '.join(SUPPORTED_EXTENSIONS)}"
+            f"Unsupported file format: {suffix}. Supported formats: {', '.join(sorted(SUPPORTED_EXTENSIONS))}"
         )
 
-    return path
+    return Path(file_path)
+
+
+def _write_changeset(base_file: str, compare_file: str, changeset_path: str) -> None:
+    """
+    Write the changeset between two GeoPackage files to changeset_path.
+
+    Raises:
+        GeoDiffError: If changeset creation fails.
+    """
+    try:
+        geodiff = _get_geodiff()
+        geodiff.create_changeset(base_file, compare_file, changeset_path)
+    except pygeodiff.GeoDiffLibError as e:
+        raise GeoDiffError(f"Failed to create changeset: {e}") from e
 
 
 def create_changeset(base_file: str, compare_file: str) -> tuple[str, Path]:
@@ -65,14 +103,76 @@ def create_changeset(base_file: str, compare_file: str) -> tuple[str, Path]:
     changeset_path = temp_dir / "changeset.diff"
 
     try:
-        geodiff = pygeodiff.GeoDiff()
-        geodiff.create_changeset(base_file, compare_file, str(changeset_path))
-    except pygeodiff.GeoDiffLibError as e:
-        raise GeoDiffError(f"Failed to create changeset: {e}") from e
+        _write_changeset(base_file, compare_file, str(changeset_path))
+    except GeoDiffError:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
 
     return str(changeset_path), temp_dir
 
 
+def stream_changes(changeset_path: str) -> Iterator[tuple[str, str]]:
+    """
+    Stream the changes of a changeset one at a time.
+
+    Entries are read lazily from the changeset, so memory use does not grow
+    with its size. Operations other than insert, update and delete are skipped.
+
+    Args:
+        changeset_path: Path to the changeset diff file.
+
+    Yields:
+        Tuples of (table_name, change_type), e.g. ("cities", "insert").
+
+    Raises:
+        GeoDiffError: If reading the changeset fails.
+    """
+    try:
+        geodiff = _get_geodiff()
+        for entry in geodiff.read_changeset(changeset_path):
+            change_type = _OP_TYPES.get(entry.operation)
+            if change_type is not None:
+                yield entry.table.name, change_type
+    except pygeodiff.GeoDiffLibError as e:
+        raise GeoDiffError(f"Failed to list changes: {e}") from e
+
+
+def _scan_changeset(changeset_path: str) -> tuple[dict[str, int], dict[str, list[dict[str, str]]]]:
+    """
+    Read a changeset once, collecting change counts and per-table changes.
+
+    Args:
+        changeset_path: Path to the changeset diff file.
+
+    Returns:
+        Tuple of (counts, tables_changes) where counts holds "total_changes",
+        "inserts", "updates" and "deletes", and tables_changes maps each table
+        name to its list of changes in changeset order (e.g. [{"type": "insert"}, ...]).
+
+    Raises:
+        GeoDiffError: If reading the changeset fails.
+    """
+    op_counts = {"insert": 0, "update": 0, "delete": 0}
+    tables_changes: defaultdict[str, list[dict[str, str]]] = defaultdict(list)
+
+    for table_name, change_type in stream_changes(changeset_path):
+        op_counts[change_type] += 1
+        tables_changes[table_name].append({"type": change_type})
+
+    counts = {
+        "total_changes": sum(op_counts.values()),
+        "inserts": op_counts["insert"],
+        "updates": op_counts["update"],
+        "deletes": op_counts["delete"],
+    }
+    return counts, dict(tables_changes)
+
+
+def _build_changes_detail(tables_changes: dict[str, list[dict[str, str]]]) -> dict[str, Any]:
+    """Build the {"geodiff": [...]} structure from per-table changes."""
+    return {"geodiff": [{"table": table, "changes": changes} for table, changes in tables_changes.items()]}
+
+
 def list_changes_json(changeset_path: str) -> dict[str, Any]:
     """
     Export changes from a binary diff file to JSON format.
@@ -97,39 +197,8 @@ def list_changes_json(changeset_path: str) -> dict[str, Any]:
     Raises:
         GeoDiffError: If listing changes fails.
     """
-    try:
-        geodiff = pygeodiff.GeoDiff()
-        reader = geodiff.read_changeset(changeset_path)
-
-        # Group changes by table
-        tables_changes: dict[str, list[dict[str, str]]] = {}
-
-        for entry in reader:
-            table_name = entry.table.name
-            op = entry.operation
-
-            # Determine change type
-            if op == entry.OP_INSERT:
-                change_type = "insert"
-            elif op == entry.OP_UPDATE:
-                change_type = "update"
-            elif op == entry.OP_DELETE:
-                change_type = "delete"
-            else:
-                continue  # Skip unknown operations
-
-            if table_name not in tables_changes:
-                tables_changes[table_name] = []
-
-            tables_changes[table_name].append({"type": change_type})
-
-        # Build result in expected format
-        result = {"geodiff": [{"table": table, "changes": changes} for table, changes in tables_changes.items()]}
-
-        return result
-
-    except pygeodiff.GeoDiffLibError as e:
-        raise GeoDiffError(f"Failed to list changes: {e}") from e
+    _, tables_changes = _scan_changeset(changeset_path)
+    return _build_changes_detail(tables_changes)
 
 
 def has_changes(changeset_path: str) -> bool:
@@ -143,7 +212,7 @@ def has_changes(changeset_path: str) -> bool:
         True if there are changes, False otherwise.
     """
     try:
-        geodiff = pygeodiff.GeoDiff()
+        geodiff = _get_geodiff()
         return geodiff.has_changes(changeset_path)
     except pygeodiff.GeoDiffLibError:
         return False
@@ -160,7 +229,7 @@ def count_changes(changeset_path: str) -> int:
         Number of changes in the changeset.
     """
     try:
-        geodiff = pygeodiff.GeoDiff()
+        geodiff = _get_geodiff()
         return geodiff.changes_count(changeset_path)
     except pygeodiff.GeoDiffLibError:
         return 0
@@ -184,58 +253,21 @@ def compute_diff(base_file: str, compare_file: str) -> dict[str, Any]:
     base_path = validate_file(base_file)
     compare_path = validate_file(compare_file)
 
-    # Create changeset
-    changeset_path, temp_dir = create_changeset(base_file, compare_file)
+    # The changeset only lives as long as the temporary directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        changeset_path = str(Path(temp_dir) / "changeset.diff")
+        _write_changeset(base_file, compare_file, changeset_path)
 
-    try:
-        # Check if there are changes
-        changes_exist = has_changes(changeset_path)
-        change_count = count_changes(changeset_path)
-
-        # Get detailed changes
-        if changes_exist:
-            changes_detail = list_changes_json(changeset_path)
-        else:
-            changes_detail = {"geodiff": []}
-
-        # Parse changes to get summary
-        geodiff_changes = changes_detail.get("geodiff", [])
-
-        # Count by operation type
-        insert_count = 0
-        update_count = 0
-        delete_count = 0
-
-        for table_changes in geodiff_changes:
-            for change in table_changes.get("changes", []):
-                op = change.get("type", "")
-                if op == "insert":
-                    insert_count += 1
-                elif op == "update":
-                    update_count += 1
-                elif op == "delete":
-                    delete_count += 1
-
-        return {
-            "base_file": str(base_path),
-            "compare_file": str(compare_path),
-            "has_changes": changes_exist,
-            "summary": {
-                "total_changes": change_count,
-                "inserts": insert_count,
-                "updates": update_count,
-                "deletes": delete_count,
-            },
-            "changes": changes_detail,
-        }
+        # Read the changeset once for counts and per-table details
+        summary, tables_changes = _scan_changeset(changeset_path)
 
-    finally:
-        # Cleanup temp files
-        changeset_file = Path(changeset_path)
-        if changeset_file.exists():
-            changeset_file.unlink()
-        if temp_dir.exists():
-            temp_dir.rmdir()
+    return {
+        "base_file": str(base_path),
+        "compare_file": str(compare_path),
+        "has_changes": summary["total_changes"] > 0,
+        "summary": summary,
+        "changes": _build_changes_detail(tables_changes),
+    }
 
 
 def format_output(diff_result: dict[str, Any], output_format: str = "json") -> str:
@@ -264,10 +296,10 @@ def format_output(diff_result: dict[str, Any], output_format: str = "json") -> s
         geodiff_changes = diff_result.get("changes", {}).get("geodiff", [])
         if geodiff_changes:
             lines.append("\n  Tables affected:")
-            for table in geodiff_changes:
-                table_name = table.get("table", "unknown")
-                table_changes = len(table.get("changes", []))
-                lines.append(f"    - {table_name}: {table_changes} change(s)")
+            lines.extend(
+                f"    - {table.get('table', 'unknown')}: {len(table.get('changes', ()))} change(s)"
+                for table in geodiff_changes
+            )
 
         return "\n".join(lines)
 
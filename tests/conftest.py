@@ -1,21 +1,17 @@
 """Pytest configuration and fixtures for geodiff tests."""
 
-import shutil
+import random
 import sqlite3
 import struct
-import tempfile
 from pathlib import Path
 
 import pytest
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    tmpdir = tempfile.mkdtemp()
-    yield Path(tmpdir)
-    # Cleanup
-    shutil.rmtree(tmpdir, ignore_errors=True)
+# GeoPackage point geometry: GP header followed by a little-endian WKB point
+# - Magic number 'GP', version 0, flags 0x01 (little-endian, no envelope), SRS ID
+# - WKB byte order 1 (little-endian), geometry type 1 (Point), X (lon), Y (lat)
+_GPKG_POINT = struct.Struct("<2sbbibIdd")
 
 
 def create_gpkg_point_geometry(lon: float, lat: float, srs_id: int = 4326) -> bytes:
@@ -30,32 +26,113 @@ def create_gpkg_point_geometry(lon: float, lat: float, srs_id: int = 4326) -> by
     Returns:
         Binary GeoPackage geometry (GP header + WKB).
     """
-    # GeoPackage binary header
-    # Magic number: 'GP' (0x4750)
-    # Version: 0
-    # Flags: 0x01 (little-endian WKB, no envelope)
-    # SRS ID: 4 bytes
-    gp_header = b"GP"
-    gp_header += struct.pack("<bb", 0, 1)  # Version 0, flags
-    gp_header += struct.pack("<i", srs_id)  # SRS ID
-
-    # WKB Point geometry (little-endian)
-    # Byte order: 1 (little-endian)
-    # Geometry type: 1 (Point)
-    # X coordinate: 8 bytes double
-    # Y coordinate: 8 bytes double
-    wkb = struct.pack("<bI", 1, 1)  # Little-endian, Point type
-    wkb += struct.pack("<dd", lon, lat)  # X (lon), Y (lat)
-
-    return gp_header + wkb
+    return _GPKG_POINT.pack(b"GP", 0, 1, srs_id, 1, 1, lon, lat)
+
+
+# GeoPackage required metadata tables (OGC GeoPackage spec) and default SRS rows
+_METADATA_DDL = """
+    BEGIN IMMEDIATE;
+
+    -- Spatial Reference Systems table
+    CREATE TABLE gpkg_spatial_ref_sys (
+        srs_name TEXT NOT NULL,
+        srs_id INTEGER NOT NULL PRIMARY KEY,
+        organization TEXT NOT NULL,
+        organization_coordsys_id INTEGER NOT NULL,
+        definition TEXT NOT NULL,
+        description TEXT
+    );
+
+    -- Contents table (registry of all tables)
+    CREATE TABLE gpkg_contents (
+        table_name TEXT NOT NULL PRIMARY KEY,
+        data_type TEXT NOT NULL,
+        identifier TEXT UNIQUE,
+        description TEXT DEFAULT '',
+        last_change DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+        min_x DOUBLE,
+        min_y DOUBLE,
+        max_x DOUBLE,
+        max_y DOUBLE,
+        srs_id INTEGER,
+        CONSTRAINT fk_gc_r_srs_id FOREIGN KEY (srs_id) REFERENCES gpkg_spatial_ref_sys(srs_id)
+    );
+
+    -- Geometry columns table
+    CREATE TABLE gpkg_geometry_columns (
+        table_name TEXT NOT NULL,
+        column_name TEXT NOT NULL,
+        geometry_type_name TEXT NOT NULL,
+        srs_id INTEGER NOT NULL,
+        z TINYINT NOT NULL,
+        m TINYINT NOT NULL,
+        CONSTRAINT pk_geom_cols PRIMARY KEY (table_name, column_name),
+        CONSTRAINT fk_gc_tn FOREIGN KEY (table_name) REFERENCES gpkg_contents(table_name),
+        CONSTRAINT fk_gc_srs FOREIGN KEY (srs_id) REFERENCES gpkg_spatial_ref_sys(srs_id)
+    );
+
+    -- Insert WGS84 spatial reference system (EPSG:4326)
+    INSERT INTO gpkg_spatial_ref_sys (srs_name, srs_id, organization, organization_coordsys_id, definition, description)
+    VALUES (
+        'WGS 84 geodetic',
+        4326,
+        'EPSG',
+        4326,
+        'GEOGCS["WGS 84",DATUM["WGS_1984",SPHEROID["WGS 84",6378137,298.257223563,AUTHORITY["EPSG","7030"]],AUTHORITY["EPSG","6326"]],PRIMEM["Greenwich",0,AUTHORITY["EPSG","8901"]],UNIT["degree",0.0174532925199433,AUTHORITY["EPSG","9122"]],AUTHORITY["EPSG","4326"]]',
+        'longitude/latitude coordinates in decimal degrees on the WGS 84 spheroid'
+    );
+
+    -- Insert undefined Cartesian SRS
+    INSERT INTO gpkg_spatial_ref_sys (srs_name, srs_id, organization, organization_coordsys_id, definition)
+    VALUES ('Undefined cartesian SRS', -1, 'NONE', -1, 'undefined');
+
+    -- Insert undefined geographic SRS
+    INSERT INTO gpkg_spatial_ref_sys (srs_name, srs_id, organization, organization_coordsys_id, definition)
+    VALUES ('Undefined geographic SRS', 0, 'NONE', 0, 'undefined');
+
+    COMMIT;
+"""
+
+
+def _create_gpkg_metadata(cursor: sqlite3.Cursor) -> None:
+    """Create the GeoPackage metadata tables and default SRS rows."""
+    cursor.executescript(_METADATA_DDL)
+
+
+def _save_database(conn: sqlite3.Connection, filepath: Path) -> None:
+    """Write an in-memory database to filepath, as a single write where supported."""
+    if hasattr(conn, "serialize"):  # Python 3.11+
+        filepath.write_bytes(conn.serialize())
+        return
+
+    dest = sqlite3.connect(filepath)
+    try:
+        conn.backup(dest)
+    finally:
+        dest.close()
+
+
+def create_gpkg_template() -> sqlite3.Connection:
+    """
+    Create an in-memory GeoPackage with only the metadata tables and default SRS rows.
+
+    Returns:
+        Open connection to the template, to be cloned with Connection.backup().
+    """
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    cursor = conn.cursor()
+    _create_gpkg_metadata(cursor)
+
+    return conn
 
 
 def create_geopackage(
-    filepath: str,
+    filepath: Path,
     table_name: str = "locations",
     features: list[dict] | None = None,
     description: str = "Test GeoPackage",
-) -> str:
+    template: sqlite3.Connection | None = None,
+) -> Path:
     """
     Create a GeoPackage file with point features representing real geographic locations.
 
@@ -69,80 +146,35 @@ def create_geopackage(
             - lat: Latitude in degrees
             - description: Optional description
         description: Description for the GeoPackage contents.
+        template: Optional connection from create_gpkg_template whose metadata
+            tables are cloned with Connection.backup() instead of being created.
 
     Returns:
         Path to the created GeoPackage.
     """
+    # Every statement below assumes a brand-new database
+    assert not filepath.exists(), f"{filepath} already exists"
+
     if features is None:
         features = []
 
-    conn = sqlite3.connect(filepath)
+    # Build in memory and write the finished database to disk in one go.
+    # Autocommit mode: transactions are driven explicitly, not by the driver.
+    conn = sqlite3.connect(":memory:", isolation_level=None)
     cursor = conn.cursor()
 
-    # Create GeoPackage required metadata tables (OGC GeoPackage spec)
-    cursor.executescript("""
-        -- Spatial Reference Systems table
-        CREATE TABLE IF NOT EXISTS gpkg_spatial_ref_sys (
-            srs_name TEXT NOT NULL,
-            srs_id INTEGER NOT NULL PRIMARY KEY,
-            organization TEXT NOT NULL,
-            organization_coordsys_id INTEGER NOT NULL,
-            definition TEXT NOT NULL,
-            description TEXT
-        );
-
-        -- Contents table (registry of all tables)
-        CREATE TABLE IF NOT EXISTS gpkg_contents (
-            table_name TEXT NOT NULL PRIMARY KEY,
-            data_type TEXT NOT NULL,
-            identifier TEXT UNIQUE,
-            description TEXT DEFAULT '',
-            last_change DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
-            min_x DOUBLE,
-            min_y DOUBLE,
-            max_x DOUBLE,
-            max_y DOUBLE,
-            srs_id INTEGER,
-            CONSTRAINT fk_gc_r_srs_id FOREIGN KEY (srs_id) REFERENCES gpkg_spatial_ref_sys(srs_id)
-        );
-
-        -- Geometry columns table
-        CREATE TABLE IF NOT EXISTS gpkg_geometry_columns (
-            table_name TEXT NOT NULL,
-            column_name TEXT NOT NULL,
-            geometry_type_name TEXT NOT NULL,
-            srs_id INTEGER NOT NULL,
-            z TINYINT NOT NULL,
-            m TINYINT NOT NULL,
-            CONSTRAINT pk_geom_cols PRIMARY KEY (table_name, column_name),
-            CONSTRAINT fk_gc_tn FOREIGN KEY (table_name) REFERENCES gpkg_contents(table_name),
-            CONSTRAINT fk_gc_srs FOREIGN KEY (srs_id) REFERENCES gpkg_spatial_ref_sys(srs_id)
-        );
-
-        -- Insert WGS84 spatial reference system (EPSG:4326)
-        INSERT OR IGNORE INTO gpkg_spatial_ref_sys (srs_name, srs_id, organization, organization_coordsys_id, definition, description)
-        VALUES (
-            'WGS 84 geodetic',
-            4326,
-            'EPSG',
-            4326,
-            'GEOGCS["WGS 84",DATUM["WGS_1984",SPHEROID["WGS 84",6378137,298.257223563,AUTHORITY["EPSG","7030"]],AUTHORITY["EPSG","6326"]],PRIMEM["Greenwich",0,AUTHORITY["EPSG","8901"]],UNIT["degree",0.0174532925199433,AUTHORITY["EPSG","9122"]],AUTHORITY["EPSG","4326"]]',
-            'longitude/latitude coordinates in decimal degrees on the WGS 84 spheroid'
-        );
-
-        -- Insert undefined Cartesian SRS
-        INSERT OR IGNORE INTO gpkg_spatial_ref_sys (srs_name, srs_id, organization, organization_coordsys_id, definition)
-        VALUES ('Undefined cartesian SRS', -1, 'NONE', -1, 'undefined');
-
-        -- Insert undefined geographic SRS
-        INSERT OR IGNORE INTO gpkg_spatial_ref_sys (srs_name, srs_id, organization, organization_coordsys_id, definition)
-        VALUES ('Undefined geographic SRS', 0, 'NONE', 0, 'undefined');
-    """)
+    if template is not None:
+        template.backup(conn)
+    else:
+        _create_gpkg_metadata(cursor)
+
+    # Create and fill the feature table in a single transaction
+    cursor.execute("BEGIN IMMEDIATE")
 
     # Create the feature table with geographic attributes
     cursor.execute(f"""
-        CREATE TABLE IF NOT EXISTS {table_name} (
-            fid INTEGER PRIMARY KEY AUTOINCREMENT,
+        CREATE TABLE {table_name} (
+            fid INTEGER PRIMARY KEY,
             geom BLOB,
             name TEXT NOT NULL,
             description TEXT,
@@ -163,7 +195,7 @@ def create_geopackage(
     # Register in gpkg_contents
     cursor.execute(
         """
-        INSERT OR REPLACE INTO gpkg_contents (table_name, data_type, identifier, description, srs_id, min_x, min_y, max_x, max_y)
+        INSERT INTO gpkg_contents (table_name, data_type, identifier, description, srs_id, min_x, min_y, max_x, max_y)
         VALUES (?, 'features', ?, ?, 4326, ?, ?, ?, ?)
         """,
         (table_name, table_name, description, min_x, min_y, max_x, max_y),
@@ -172,37 +204,40 @@ def create_geopackage(
     # Register in gpkg_geometry_columns
     cursor.execute(
         """
-        INSERT OR REPLACE INTO gpkg_geometry_columns (table_name, column_name, geometry_type_name, srs_id, z, m)
+        INSERT INTO gpkg_geometry_columns (table_name, column_name, geometry_type_name, srs_id, z, m)
         VALUES (?, 'geom', 'POINT', 4326, 0, 0)
         """,
         (table_name,),
     )
 
     # Insert features with real geographic data
+    rows_with_fid = []
+    rows_auto_fid = []
     for feature in features:
+        values = (
+            create_gpkg_point_geometry(feature.get("lon", 0.0), feature.get("lat", 0.0)),
+            feature.get("name", "Unknown"),
+            feature.get("description", ""),
+            feature.get("population"),
+            feature.get("elevation_m"),
+        )
         fid = feature.get("id")
-        name = feature.get("name", "Unknown")
-        lon = feature.get("lon", 0.0)
-        lat = feature.get("lat", 0.0)
-        desc = feature.get("description", "")
-        population = feature.get("population")
-        elevation = feature.get("elevation_m")
-
-        # Create GeoPackage point geometry
-        gpkg_geom = create_gpkg_point_geometry(lon, lat)
-
         if fid is not None:
-            cursor.execute(
-                f"INSERT INTO {table_name} (fid, geom, name, description, population, elevation_m) VALUES (?, ?, ?, ?, ?, ?)",
-                (fid, gpkg_geom, name, desc, population, elevation),
-            )
+            rows_with_fid.append((fid, *values))
         else:
-            cursor.execute(
-                f"INSERT INTO {table_name} (geom, name, description, population, elevation_m) VALUES (?, ?, ?, ?, ?)",
-                (gpkg_geom, name, desc, population, elevation),
-            )
+            rows_auto_fid.append(values)
+
+    cursor.executemany(
+        f"INSERT INTO {table_name} (fid, geom, name, description, population, elevation_m) VALUES (?, ?, ?, ?, ?, ?)",
+        rows_with_fid,
+    )
+    cursor.executemany(
+        f"INSERT INTO {table_name} (geom, name, description, population, elevation_m) VALUES (?, ?, ?, ?, ?)",
+        rows_auto_fid,
+    )
 
-    conn.commit()
+    cursor.execute("COMMIT")
+    _save_database(conn, filepath)
     conn.close()
 
     return filepath
@@ -310,40 +345,132 @@ ITALIAN_CITIES_MODIFIED = [
 ]
 
 
-@pytest.fixture
-def base_gpkg(temp_dir):
+ITALIAN_REGIONS = [
+    "Lombardia",
+    "Lazio",
+    "Campania",
+    "Sicilia",
+    "Veneto",
+    "Emilia-Romagna",
+    "Piemonte",
+    "Puglia",
+    "Toscana",
+    "Calabria",
+]
+
+
+def generate_locations(count: int, seed: int = 42) -> list[dict]:
+    """
+    Generate reproducible point features across Italy's approximate bounding box.
+
+    Uses a private random.Random so the global random state is left untouched.
+
+    Args:
+        count: Number of features to generate.
+        seed: Seed for the random generator.
+
+    Returns:
+        List of feature dicts suitable for create_geopackage.
+    """
+    rng = random.Random(seed)
+    uniform, randint, choice = rng.uniform, rng.randint, rng.choice
+
+    # lon: 6.6 to 18.5, lat: 36.6 to 47.1
+    return [
+        {
+            "id": i,
+            "name": f"Location_{i:03d}",
+            "lon": uniform(6.6, 18.5),
+            "lat": uniform(36.6, 47.1),
+            "description": f"Test location in {choice(ITALIAN_REGIONS)}",
+            "population": randint(1000, 500000),
+            "elevation_m": uniform(0, 2000),
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def _fixture_geopackages() -> dict[str, dict]:
+    """Return the fixture GeoPackages as file name -> create_geopackage arguments."""
+    return {
+        "italian_cities_base.gpkg": {
+            "table_name": "cities",
+            "features": ITALIAN_CITIES_BASE,
+            "description": "Italian cities dataset - Base version",
+        },
+        "italian_cities_identical.gpkg": {
+            "table_name": "cities",
+            "features": ITALIAN_CITIES_BASE,
+            "description": "Italian cities dataset - Identical copy",
+        },
+        "italian_cities_modified.gpkg": {
+            "table_name": "cities",
+            "features": ITALIAN_CITIES_MODIFIED,
+            "description": "Italian cities dataset - Modified version",
+        },
+        "italian_cities_empty.gpkg": {
+            "table_name": "cities",
+            "features": [],
+            "description": "Italian cities dataset - Empty",
+        },
+        "single_city.gpkg": {
+            "table_name": "cities",
+            "features": [ITALIAN_CITIES_BASE[0]],  # Just Roma
+            "description": "Single city dataset",
+        },
+        "large_dataset.gpkg": {
+            "table_name": "locations",
+            "features": generate_locations(50),
+            "description": "Large test dataset with 50 locations",
+        },
+    }
+
+
+@pytest.fixture(scope="session")
+def _gpkg_template():
+    """Create the in-memory metadata-only GeoPackage template once per session."""
+    conn = create_gpkg_template()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def _gpkg_cache(tmp_path_factory, _gpkg_template):
+    """
+    Build every _fixture_geopackages() entry once per session.
+
+    Returns a dict mapping each file name to the path of the cached file.
+    """
+    cache_dir = tmp_path_factory.mktemp("gpkg_cache")
+
+    return {
+        filename: create_geopackage(cache_dir / filename, template=_gpkg_template, **kwargs)
+        for filename, kwargs in _fixture_geopackages().items()
+    }
+
+
+@pytest.fixture(scope="session")
+def base_gpkg(_gpkg_cache):
     """
     Create a base GeoPackage with Italian cities.
 
     Contains 5 cities: Roma, Milano, Napoli, Torino, Firenze
     """
-    filepath = temp_dir / "italian_cities_base.gpkg"
-    return create_geopackage(
-        str(filepath),
-        table_name="cities",
-        features=ITALIAN_CITIES_BASE,
-        description="Italian cities dataset - Base version",
-    )
+    return str(_gpkg_cache["italian_cities_base.gpkg"])
 
 
-@pytest.fixture
-def identical_gpkg(temp_dir):
+@pytest.fixture(scope="session")
+def identical_gpkg(_gpkg_cache):
     """
     Create a GeoPackage identical to base for testing no-change scenarios.
 
     Contains the same 5 cities as base_gpkg.
     """
-    filepath = temp_dir / "italian_cities_identical.gpkg"
-    return create_geopackage(
-        str(filepath),
-        table_name="cities",
-        features=ITALIAN_CITIES_BASE,
-        description="Italian cities dataset - Identical copy",
-    )
+    return str(_gpkg_cache["italian_cities_identical.gpkg"])
 
 
-@pytest.fixture
-def modified_gpkg(temp_dir):
+@pytest.fixture(scope="session")
+def modified_gpkg(_gpkg_cache):
     """
     Create a GeoPackage with modifications for testing change detection.
 
@@ -356,87 +483,140 @@ def modified_gpkg(temp_dir):
     - Bologna (id=6): Added
     - Venezia (id=7): Added
     """
-    filepath = temp_dir / "italian_cities_modified.gpkg"
-    return create_geopackage(
-        str(filepath),
-        table_name="cities",
-        features=ITALIAN_CITIES_MODIFIED,
-        description="Italian cities dataset - Modified version",
-    )
+    return str(_gpkg_cache["italian_cities_modified.gpkg"])
 
 
-@pytest.fixture
-def empty_gpkg(temp_dir):
+@pytest.fixture(scope="session")
+def empty_gpkg(_gpkg_cache):
     """
     Create an empty GeoPackage with schema only (no features).
 
     Useful for testing insert-only and delete-only scenarios.
     """
-    filepath = temp_dir / "italian_cities_empty.gpkg"
-    return create_geopackage(
-        str(filepath),
-        table_name="cities",
-        features=[],
-        description="Italian cities dataset - Empty",
-    )
+    return str(_gpkg_cache["italian_cities_empty.gpkg"])
 
 
-@pytest.fixture
-def single_feature_gpkg(temp_dir):
+@pytest.fixture(scope="session")
+def single_feature_gpkg(_gpkg_cache):
     """Create a GeoPackage with a single feature for minimal testing."""
-    filepath = temp_dir / "single_city.gpkg"
-    return create_geopackage(
-        str(filepath),
-        table_name="cities",
-        features=[ITALIAN_CITIES_BASE[0]],  # Just Roma
-        description="Single city dataset",
-    )
+    return str(_gpkg_cache["single_city.gpkg"])
 
 
-@pytest.fixture
-def large_gpkg(temp_dir):
+@pytest.fixture(scope="session")
+def large_gpkg(_gpkg_cache):
     """
     Create a larger GeoPackage with more features for performance testing.
 
     Contains 50 generated points across Italy.
     """
-    import random
+    return str(_gpkg_cache["large_dataset.gpkg"])
+
+
+# Bare GeoPackage metadata tables and the WGS 84 row shared by the hand-built schemas below
+_MINIMAL_GPKG_DDL = """
+    CREATE TABLE gpkg_spatial_ref_sys (srs_name TEXT, srs_id INTEGER PRIMARY KEY, organization TEXT, organization_coordsys_id INTEGER, definition TEXT, description TEXT);
+    CREATE TABLE gpkg_contents (table_name TEXT PRIMARY KEY, data_type TEXT, identifier TEXT, description TEXT, last_change DATETIME, min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE, srs_id INTEGER);
+    CREATE TABLE gpkg_geometry_columns (table_name TEXT, column_name TEXT, geometry_type_name TEXT, srs_id INTEGER, z TINYINT, m TINYINT, PRIMARY KEY (table_name, column_name));
+    INSERT INTO gpkg_spatial_ref_sys VALUES ('WGS 84', 4326, 'EPSG', 4326, 'GEOGCS["WGS 84"]', NULL);
+"""
+
+
+def _build_schema_gpkg(filepath: Path, layer_ddl: str) -> Path:
+    """Build a bare GeoPackage plus layer_ddl in memory and write it to filepath."""
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.executescript(f"""
+        BEGIN IMMEDIATE;
+        {_MINIMAL_GPKG_DDL}
+        {layer_ddl}
+        COMMIT;
+    """)
+    _save_database(conn, filepath)
+    conn.close()
+    return filepath
 
-    random.seed(42)  # Reproducible test data
 
-    # Generate points across Italy's approximate bounding box
-    # lon: 6.6 to 18.5, lat: 36.6 to 47.1
-    features = []
-    italian_regions = [
-        "Lombardia",
-        "Lazio",
-        "Campania",
-        "Sicilia",
-        "Veneto",
-        "Emilia-Romagna",
-        "Piemonte",
-        "Puglia",
-        "Toscana",
-        "Calabria",
-    ]
+@pytest.fixture(scope="session")
+def _gpkg_skeleton(tmp_path_factory):
+    """
+    Create a GeoPackage skeleton with the metadata tables and an empty data table.
 
-    for i in range(1, 51):
-        features.append(
-            {
-                "id": i,
-                "name": f"Location_{i:03d}",
-                "lon": random.uniform(6.6, 18.5),
-                "lat": random.uniform(36.6, 47.1),
-                "description": f"Test location in {random.choice(italian_regions)}",
-                "population": random.randint(1000, 500000),
-                "elevation_m": random.uniform(0, 2000),
-            }
-        )
+    Tests copy it to whatever file name (and extension) they need.
+
+    Returns:
+        Path to the skeleton file.
+    """
+    skeleton = tmp_path_factory.mktemp("skeleton") / "skeleton.gpkg"
 
-    filepath = temp_dir / "large_dataset.gpkg"
-    return create_geopackage(
-        str(filepath),
-        table_name="locations",
-        features=features,
-        description="Large test dataset with 50 locations",
+    return _build_schema_gpkg(
+        skeleton,
+        """
+        CREATE TABLE data (fid INTEGER PRIMARY KEY, name TEXT);
+        INSERT INTO gpkg_contents VALUES ('data', 'features', 'data', '', datetime('now'), NULL, NULL, NULL, NULL, 4326);
+        """,
     )
+
+
+# Feature layers of the incompatible schema pair: file name -> layer DDL
+_INCOMPATIBLE_SCHEMAS = {
+    "schema1.gpkg": """
+        CREATE TABLE layer_a (fid INTEGER PRIMARY KEY, geom BLOB, name TEXT);
+        INSERT INTO gpkg_contents VALUES ('layer_a', 'features', 'layer_a', '', datetime('now'), NULL, NULL, NULL, NULL, 4326);
+        INSERT INTO gpkg_geometry_columns VALUES ('layer_a', 'geom', 'POINT', 4326, 0, 0);
+    """,
+    "schema2.gpkg": """
+        CREATE TABLE layer_b (fid INTEGER PRIMARY KEY, geom BLOB, description TEXT, value REAL);
+        INSERT INTO gpkg_contents VALUES ('layer_b', 'features', 'layer_b', '', datetime('now'), NULL, NULL, NULL, NULL, 4326);
+        INSERT INTO gpkg_geometry_columns VALUES ('layer_b', 'geom', 'POINT', 4326, 0, 0);
+    """,
+}
+
+
+@pytest.fixture(scope="session")
+def incompatible_gpkg_pair(tmp_path_factory):
+    """
+    Create two minimal GeoPackages whose feature tables have different schemas.
+
+    pygeodiff cannot create a changeset between them.
+
+    Returns:
+        Tuple of (schema1.gpkg, schema2.gpkg) paths.
+    """
+    directory = tmp_path_factory.mktemp("schemas")
+
+    gpkg1, gpkg2 = (
+        _build_schema_gpkg(directory / filename, layer_ddl) for filename, layer_ddl in _INCOMPATIBLE_SCHEMAS.items()
+    )
+
+    return gpkg1, gpkg2
+
+
+@pytest.fixture(scope="session")
+def minimal_gpkg_pair(tmp_path_factory):
+    """
+    Create two identical minimal GeoPackages with a single-row test_layer.
+
+    Meant for tests that mock pygeodiff and only need valid input files.
+
+    Returns:
+        Tuple of (base_mock.gpkg, compare_mock.gpkg) paths.
+    """
+    directory = tmp_path_factory.mktemp("minimal")
+    gpkg1 = directory / "base_mock.gpkg"
+    gpkg2 = directory / "compare_mock.gpkg"
+
+    # Build the schema once in memory and write it out to both files
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.executescript(f"""
+        BEGIN IMMEDIATE;
+        {_MINIMAL_GPKG_DDL}
+        CREATE TABLE test_layer (fid INTEGER PRIMARY KEY, geom BLOB, name TEXT);
+        INSERT INTO gpkg_contents VALUES ('test_layer', 'features', 'test_layer', '', datetime('now'), NULL, NULL, NULL, NULL, 4326);
+        INSERT INTO gpkg_geometry_columns VALUES ('test_layer', 'geom', 'POINT', 4326, 0, 0);
+        INSERT INTO test_layer (fid, name) VALUES (1, 'Point A');
+        COMMIT;
+    """)
+    for gpkg in (gpkg1, gpkg2):
+        _save_database(conn, gpkg)
+    conn.close()
+
+    return gpkg1, gpkg2
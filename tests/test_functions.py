@@ -4,11 +4,10 @@ import subprocess  # noqa: F401
 
 import pytest
 
-import sys
+from functions import check_output
 
-sys.path.insert(0, "src")
 
-from functions import check_output
+pytestmark = pytest.mark.fast
 
 
 class TestCheckOutput:
@@ -9,27 +9,130 @@ The test fixtures use real geographic coordinates for Italian cities:
 """
 
 import json
+import os
+import re
+import shutil
+import tempfile
+from collections import Counter
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import pygeodiff
 import pytest
 
-import sys
-
-sys.path.insert(0, "src")
-
 from geodiff import (
     SUPPORTED_EXTENSIONS,
     GeoDiffError,
+    _get_geodiff,
     compute_diff,
     count_changes,
     create_changeset,
     format_output,
     has_changes,
     list_changes_json,
+    stream_changes,
     validate_file,
 )
 
+# Keys every compute_diff result and its summary must contain
+_TOP_KEYS = frozenset({"base_file", "compare_file", "has_changes", "summary", "changes"})
+_SUMMARY_KEYS = frozenset({"total_changes", "inserts", "updates", "deletes"})
+
+# GeoDiffError messages the tests expect, compiled once
+_FILE_NOT_FOUND = re.compile("File not found")
+_UNSUPPORTED_FORMAT = re.compile("Unsupported file format")
+_FAILED_LIST = re.compile("Failed to list changes")
+_FAILED_CHANGESET = re.compile("Failed to create changeset")
+
+# Table entry for the cities layer in the summary's "Tables affected" list
+_CITIES_RE = re.compile(r"(?m)^\s*- cities:")
+
+
+# Changesets and diff results shared by tests that only read them
+
+
+def _session_changeset(base: str, compare: str):
+    """Yield a changeset path for (base, compare), removing its temp dir afterwards."""
+    changeset_path, temp_dir = create_changeset(base, compare)
+    yield changeset_path
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def make_changeset():
+    """
+    Create changesets that are removed when the test finishes.
+
+    Returns a function with the create_changeset signature and return value.
+    """
+    temp_dirs = []
+
+    def make(base_file: str, compare_file: str) -> tuple[str, Path]:
+        changeset_path, temp_dir = create_changeset(base_file, compare_file)
+        temp_dirs.append(temp_dir)
+        return changeset_path, temp_dir
+
+    yield make
+
+    for temp_dir in temp_dirs:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def changeset_identical(base_gpkg, identical_gpkg):
+    """Changeset between the base and identical GeoPackages (no changes)."""
+    yield from _session_changeset(base_gpkg, identical_gpkg)
+
+
+@pytest.fixture(scope="session")
+def changeset_modified(base_gpkg, modified_gpkg):
+    """Changeset between the base and modified GeoPackages."""
+    yield from _session_changeset(base_gpkg, modified_gpkg)
+
+
+@pytest.fixture(scope="session")
+def diff_base_modified(base_gpkg, modified_gpkg):
+    """compute_diff result from the base to the modified GeoPackage."""
+    return compute_diff(base_gpkg, modified_gpkg)
+
+
+@pytest.fixture(scope="session")
+def diff_identical(base_gpkg, identical_gpkg):
+    """compute_diff result between identical GeoPackages (no changes)."""
+    return compute_diff(base_gpkg, identical_gpkg)
+
+
+@pytest.fixture(scope="session")
+def diff_empty_base(empty_gpkg, base_gpkg):
+    """compute_diff result from the empty to the base GeoPackage (inserts only)."""
+    return compute_diff(empty_gpkg, base_gpkg)
+
+
+@pytest.fixture(scope="session")
+def diff_base_empty(base_gpkg, empty_gpkg):
+    """compute_diff result from the base to the empty GeoPackage (deletes only)."""
+    return compute_diff(base_gpkg, empty_gpkg)
+
+
+@pytest.fixture(scope="module")
+def sample_json_output(diff_base_modified):
+    """JSON output for diff_base_modified, together with its parsed form."""
+    output = format_output(diff_base_modified, "json")
+    return output, json.loads(output)
+
+
+# Tests for the shared pygeodiff instance
+
+
+@pytest.mark.fast
+class TestGetGeoDiff:
+    """Tests for the _get_geodiff helper."""
+
+    def test_get_geodiff_returns_same_instance(self):
+        """Test that the pygeodiff instance is created once and reused."""
+        assert _get_geodiff() is _get_geodiff()
+
 
 # Tests for validate_file
 
@@ -37,24 +140,43 @@ from geodiff import (
 class TestValidateFile:
     """Tests for the validate_file function."""
 
+    @pytest.mark.integration
     def test_validate_existing_gpkg(self, base_gpkg):
         """Test validating an existing GeoPackage file."""
         result = validate_file(base_gpkg)
         assert isinstance(result, Path)
         assert result.exists()
 
+    @pytest.mark.fast
     def test_validate_nonexistent_file(self):
         """Test validating a file that doesn't exist."""
-        with pytest.raises(GeoDiffError, match="File not found"):
+        with pytest.raises(GeoDiffError, match=_FILE_NOT_FOUND):
             validate_file("/nonexistent/path/file.gpkg")
 
-    def test_validate_unsupported_format(self, temp_dir):
+    @pytest.mark.fast
+    def test_validate_symlink_loop(self, tmp_path):
+        """Test that an unresolvable symlink is reported as not found."""
+        filepath = tmp_path / "loop.gpkg"
+        filepath.symlink_to(filepath)
+        with pytest.raises(GeoDiffError, match=_FILE_NOT_FOUND):
+            validate_file(str(filepath))
+
+    @pytest.mark.fast
+    def test_validate_unsupported_format(self, tmp_path):
         """Test validating a file with unsupported extension."""
-        filepath = temp_dir / "test.geojson"
-        filepath.write_text("{}")
-        with pytest.raises(GeoDiffError, match="Unsupported file format"):
+        filepath = tmp_path / "test.geojson"
+        filepath.touch()
+        with pytest.raises(GeoDiffError, match=_UNSUPPORTED_FORMAT):
             validate_file(str(filepath))
 
+    @pytest.mark.fast
+    def test_validate_uppercase_extension(self, tmp_path):
+        """Test that extension matching is case-insensitive."""
+        filepath = tmp_path / "TEST.GPKG"
+        filepath.touch()
+        assert validate_file(str(filepath)) == filepath
+
+    @pytest.mark.fast
     def test_supported_extensions(self):
         """Test that supported extensions are defined correctly."""
         assert ".gpkg" in SUPPORTED_EXTENSIONS
@@ -65,117 +187,94 @@ class TestValidateFile:
 # Tests for create_changeset
 
 
+@pytest.mark.integration
 class TestCreateChangeset:
     """Tests for the create_changeset function."""
 
-    def test_create_changeset_identical_files(self, base_gpkg, identical_gpkg):
+    def test_create_changeset_identical_files(self, base_gpkg, identical_gpkg, make_changeset):
         """Test creating a changeset between identical files."""
-        changeset_path, temp_dir = create_changeset(base_gpkg, identical_gpkg)
+        changeset_path, temp_dir = make_changeset(base_gpkg, identical_gpkg)
 
         assert Path(changeset_path).exists()
         assert temp_dir.exists()
 
-        # Cleanup
-        Path(changeset_path).unlink()
-        temp_dir.rmdir()
+    def test_create_changeset_uses_default_tempdir(self, base_gpkg, identical_gpkg, make_changeset):
+        """Test that changesets are created under the default temp directory."""
+        _, temp_dir = make_changeset(base_gpkg, identical_gpkg)
 
-    def test_create_changeset_different_files(self, base_gpkg, modified_gpkg):
-        """Test creating a changeset between different files."""
-        changeset_path, temp_dir = create_changeset(base_gpkg, modified_gpkg)
+        assert temp_dir.parent == Path(tempfile.gettempdir())
 
-        assert Path(changeset_path).exists()
-        # File should have content since there are differences
-        assert Path(changeset_path).stat().st_size > 0
+    def test_create_changeset_different_files(self, base_gpkg, modified_gpkg, make_changeset):
+        """Test creating a changeset between different files."""
+        changeset_path, temp_dir = make_changeset(base_gpkg, modified_gpkg)
 
-        # Cleanup
-        Path(changeset_path).unlink()
-        temp_dir.rmdir()
+        # File should exist and have content since there are differences
+        assert os.stat(changeset_path).st_size > 0
 
     def test_create_changeset_nonexistent_base(self, modified_gpkg):
         """Test creating changeset with nonexistent base file."""
-        with pytest.raises(GeoDiffError, match="File not found"):
+        with pytest.raises(GeoDiffError, match=_FILE_NOT_FOUND):
             create_changeset("/nonexistent/base.gpkg", modified_gpkg)
 
     def test_create_changeset_nonexistent_compare(self, base_gpkg):
         """Test creating changeset with nonexistent compare file."""
-        with pytest.raises(GeoDiffError, match="File not found"):
+        with pytest.raises(GeoDiffError, match=_FILE_NOT_FOUND):
             create_changeset(base_gpkg, "/nonexistent/compare.gpkg")
 
 
 # Tests for has_changes
 
 
+@pytest.mark.integration
 class TestHasChanges:
     """Tests for the has_changes function."""
 
-    def test_has_changes_identical_files(self, base_gpkg, identical_gpkg):
+    def test_has_changes_identical_files(self, changeset_identical):
         """Test that identical files report no changes."""
-        changeset_path, temp_dir = create_changeset(base_gpkg, identical_gpkg)
-
-        result = has_changes(changeset_path)
+        result = has_changes(changeset_identical)
         assert result is False
 
-        # Cleanup
-        Path(changeset_path).unlink()
-        temp_dir.rmdir()
-
-    def test_has_changes_different_files(self, base_gpkg, modified_gpkg):
+    def test_has_changes_different_files(self, changeset_modified):
         """Test that different files report changes."""
-        changeset_path, temp_dir = create_changeset(base_gpkg, modified_gpkg)
-
-        result = has_changes(changeset_path)
+        result = has_changes(changeset_modified)
         assert result is True
 
-        # Cleanup
-        Path(changeset_path).unlink()
-        temp_dir.rmdir()
-
 
 # Tests for count_changes
 
 
+@pytest.mark.integration
 class TestCountChanges:
     """Tests for the count_changes function."""
 
-    def test_count_changes_identical_files(self, base_gpkg, identical_gpkg):
+    def test_count_changes_identical_files(self, changeset_identical):
         """Test counting changes in identical files."""
-        changeset_path, temp_dir = create_changeset(base_gpkg, identical_gpkg)
-
-        count = count_changes(changeset_path)
+        count = count_changes(changeset_identical)
         assert count == 0
 
-        # Cleanup
-        Path(changeset_path).unlink()
-        temp_dir.rmdir()
-
-    def test_count_changes_different_files(self, base_gpkg, modified_gpkg):
+    def test_count_changes_different_files(self, changeset_modified):
         """Test counting changes in different files."""
-        changeset_path, temp_dir = create_changeset(base_gpkg, modified_gpkg)
-
-        count = count_changes(changeset_path)
+        count = count_changes(changeset_modified)
         assert count > 0  # Should have insert, update, and delete
 
-        # Cleanup
-        Path(changeset_path).unlink()
-        temp_dir.rmdir()
-
 
 # Tests for compute_diff
 
 
+@pytest.mark.integration
 class TestComputeDiff:
     """Tests for the compute_diff function."""
 
-    def test_diff_identical_files(self, base_gpkg, identical_gpkg):
+    def test_diff_identical_files(self, base_gpkg, identical_gpkg, diff_identical):
         """Test diff of identical files shows no changes."""
-        result = compute_diff(base_gpkg, identical_gpkg)
+        result = diff_identical
 
         assert result["has_changes"] is False
         assert result["summary"]["total_changes"] == 0
         assert result["base_file"] == base_gpkg
         assert result["compare_file"] == identical_gpkg
 
-    def test_diff_with_changes(self, base_gpkg, modified_gpkg):
+    def test_diff_with_changes(self, diff_base_modified):
         """Test diff with actual changes using Italian cities data.
 
         Expected changes from base to modified:
@@ -183,7 +282,7 @@ class TestComputeDiff:
         - 2 deletes: Napoli, Firenze
         - 2 inserts: Bologna, Venezia
         """
-        result = compute_diff(base_gpkg, modified_gpkg)
+        result = diff_base_modified
 
         assert result["has_changes"] is True
         assert result["summary"]["total_changes"] > 0
@@ -195,9 +294,9 @@ class TestComputeDiff:
         assert summary["updates"] >= 0
         assert summary["deletes"] >= 0
 
-    def test_diff_empty_to_populated(self, empty_gpkg, base_gpkg):
+    def test_diff_empty_to_populated(self, diff_empty_base):
         """Test diff from empty to populated file (5 Italian cities inserted)."""
-        result = compute_diff(empty_gpkg, base_gpkg)
+        result = diff_empty_base
 
         assert result["has_changes"] is True
         # All 5 cities (Roma, Milano, Napoli, Torino, Firenze) should be inserts
@@ -207,9 +306,9 @@ class TestComputeDiff:
         assert summary["deletes"] == 0
         assert summary["total_changes"] == 5
 
-    def test_diff_populated_to_empty(self, base_gpkg, empty_gpkg):
+    def test_diff_populated_to_empty(self, diff_base_empty):
         """Test diff from populated to empty file (5 Italian cities deleted)."""
-        result = compute_diff(base_gpkg, empty_gpkg)
+        result = diff_base_empty
 
         assert result["has_changes"] is True
         # All 5 cities should be deletes
@@ -221,47 +320,31 @@ class TestComputeDiff:
 
     def test_diff_nonexistent_file(self, base_gpkg):
         """Test diff with nonexistent file raises error."""
-        with pytest.raises(GeoDiffError, match="File not found"):
+        with pytest.raises(GeoDiffError, match=_FILE_NOT_FOUND):
             compute_diff(base_gpkg, "/nonexistent/compare.gpkg")
 
-    def test_diff_result_structure(self, base_gpkg, modified_gpkg):
+    def test_diff_result_structure(self, diff_base_modified):
         """Test that diff result has the expected structure."""
-        result = compute_diff(base_gpkg, modified_gpkg)
+        result = diff_base_modified
 
         # Check required keys
-        assert "base_file" in result
-        assert "compare_file" in result
-        assert "has_changes" in result
-        assert "summary" in result
-        assert "changes" in result
+        assert _TOP_KEYS <= result.keys(), f"Missing keys: {_TOP_KEYS - result.keys()}"
 
         # Check summary structure
         summary = result["summary"]
-        assert "total_changes" in summary
-        assert "inserts" in summary
-        assert "updates" in summary
-        assert "deletes" in summary
+        assert _SUMMARY_KEYS <= summary.keys(), f"Missing summary keys: {_SUMMARY_KEYS - summary.keys()}"
 
 
 # Tests for format_output
 
 
+@pytest.mark.integration
 class TestFormatOutput:
     """Tests for the format_output function."""
 
-    @pytest.fixture
-    def sample_diff_result(self, base_gpkg, modified_gpkg):
-        """Get a real diff result for formatting tests."""
-        return compute_diff(base_gpkg, modified_gpkg)
-
-    @pytest.fixture
-    def no_changes_diff_result(self, base_gpkg, identical_gpkg):
-        """Get a diff result with no changes."""
-        return compute_diff(base_gpkg, identical_gpkg)
-
-    def test_format_summary_with_changes(self, sample_diff_result):
+    def test_format_summary_with_changes(self, diff_base_modified):
         """Test summary output format with changes."""
-        output = format_output(sample_diff_result, "summary")
+        output = format_output(diff_base_modified, "summary")
 
         assert "GeoDiff Summary" in output
         assert "Has Changes:   Yes" in output
@@ -270,40 +353,36 @@ class TestFormatOutput:
         assert "Updates:" in output
         assert "Deletes:" in output
 
-    def test_format_summary_no_changes(self, no_changes_diff_result):
+    def test_format_summary_no_changes(self, diff_identical):
         """Test summary output format without changes."""
-        output = format_output(no_changes_diff_result, "summary")
+        output = format_output(diff_identical, "summary")
 
         assert "Has Changes:   No" in output
         assert "Total Changes: 0" in output
 
-    def test_format_json(self, sample_diff_result):
+    def test_format_json(self, sample_json_output):
         """Test JSON output format."""
-        output = format_output(sample_diff_result, "json")
+        _, parsed = sample_json_output
 
-        parsed = json.loads(output)
-        assert "has_changes" in parsed
-        assert "summary" in parsed
-        assert "changes" in parsed
+        assert _TOP_KEYS <= parsed.keys(), f"Missing keys: {_TOP_KEYS - parsed.keys()}"
 
-    def test_format_default_is_json(self, sample_diff_result):
+    def test_format_default_is_json(self, diff_base_modified, sample_json_output):
         """Test that default format is JSON."""
-        output = format_output(sample_diff_result, "unknown_format")
+        output = format_output(diff_base_modified, "unknown_format")
 
-        # Should be valid JSON
-        parsed = json.loads(output)
+        # Should be the same JSON as the explicit format
+        json_output, parsed = sample_json_output
+        assert output == json_output
         assert isinstance(parsed, dict)
 
-    def test_format_json_is_valid(self, sample_diff_result):
+    def test_format_json_is_valid(self, diff_base_modified, sample_json_output):
         """Test that JSON output is valid and parseable."""
-        output = format_output(sample_diff_result, "json")
-
-        # Should not raise
-        parsed = json.loads(output)
+        # Parsed once by the fixture; a parse error would fail it
+        _, parsed = sample_json_output
 
         # Should match original structure
-        assert parsed["has_changes"] == sample_diff_result["has_changes"]
-        assert parsed["summary"] == sample_diff_result["summary"]
+        assert parsed["has_changes"] == diff_base_modified["has_changes"]
+        assert parsed["summary"] == diff_base_modified["summary"]
 
 
 # Tests for list_changes_json
@@ -312,59 +391,86 @@ class TestFormatOutput:
 class TestListChangesJson:
     """Tests for the list_changes_json function."""
 
-    def test_list_changes_with_changes(self, base_gpkg, modified_gpkg):
+    @pytest.mark.integration
+    def test_list_changes_with_changes(self, changeset_modified):
         """Test listing changes from a changeset with modifications."""
-        changeset_path, temp_dir = create_changeset(base_gpkg, modified_gpkg)
-
-        changes = list_changes_json(changeset_path)
+        changes = list_changes_json(changeset_modified)
 
         assert "geodiff" in changes
         assert isinstance(changes["geodiff"], list)
 
-        # Cleanup
-        Path(changeset_path).unlink()
-        temp_dir.rmdir()
-
-    def test_list_changes_empty_changeset(self, base_gpkg, identical_gpkg):
+    @pytest.mark.integration
+    def test_list_changes_empty_changeset(self, changeset_identical):
         """Test listing changes from an empty changeset."""
-        changeset_path, temp_dir = create_changeset(base_gpkg, identical_gpkg)
-
-        changes = list_changes_json(changeset_path)
+        changes = list_changes_json(changeset_identical)
 
         assert "geodiff" in changes
         # Empty changeset should have empty geodiff list
-        assert changes["geodiff"] == [] or len(changes["geodiff"]) == 0
-
-        # Cleanup
-        Path(changeset_path).unlink()
-        temp_dir.rmdir()
+        assert not changes["geodiff"]
+
+    @pytest.mark.fast
+    def test_list_changes_keeps_changeset_order(self):
+        """Test that each table lists its changes in changeset order."""
+        entries = [
+            SimpleNamespace(table=SimpleNamespace(name="cities"), operation=pygeodiff.ChangesetEntry.OP_INSERT),
+            SimpleNamespace(table=SimpleNamespace(name="cities"), operation=pygeodiff.ChangesetEntry.OP_DELETE),
+            SimpleNamespace(table=SimpleNamespace(name="cities"), operation=pygeodiff.ChangesetEntry.OP_INSERT),
+        ]
+
+        with patch.object(_get_geodiff(), "read_changeset", return_value=iter(entries)):
+            changes = list_changes_json("unused.diff")
+
+        assert changes == {
+            "geodiff": [{"table": "cities", "changes": [{"type": "insert"}, {"type": "delete"}, {"type": "insert"}]}]
+        }
 
+    @pytest.mark.fast
     def test_list_changes_invalid_path(self):
         """Test listing changes with invalid changeset path."""
-        with pytest.raises(GeoDiffError, match="Failed to list changes"):
+        with pytest.raises(GeoDiffError, match=_FAILED_LIST):
             list_changes_json("/nonexistent/changeset.diff")
 
-    def test_list_changes_invalid_changeset_file(self, temp_dir):
+    @pytest.mark.fast
+    def test_list_changes_invalid_changeset_file(self, tmp_path):
         """Test handling of invalid changeset file in list_changes_json."""
         # Create a fake changeset file with invalid content
-        fake_changeset = temp_dir / "fake.diff"
+        fake_changeset = tmp_path / "fake.diff"
         fake_changeset.write_bytes(b"invalid binary content")
 
         # Should raise GeoDiffError when pygeodiff can't read the invalid changeset
-        with pytest.raises(GeoDiffError, match="Failed to list changes"):
+        with pytest.raises(GeoDiffError, match=_FAILED_LIST):
             list_changes_json(str(fake_changeset))
 
-    def test_list_changes_empty_file(self, base_gpkg, identical_gpkg):
+    @pytest.mark.integration
+    def test_list_changes_empty_file(self, changeset_identical):
         """Test list_changes with file that exists but is empty."""
-        changeset_path, temp_dir = create_changeset(base_gpkg, identical_gpkg)
-
         # Test with real empty changeset - should return empty geodiff
-        result = list_changes_json(changeset_path)
+        result = list_changes_json(changeset_identical)
         assert "geodiff" in result
 
-        # Cleanup
-        Path(changeset_path).unlink()
-        temp_dir.rmdir()
+
+# Tests for stream_changes
+
+
+class TestStreamChanges:
+    """Tests for the stream_changes generator."""
+
+    @pytest.mark.integration
+    def test_stream_changes_yields_table_and_type(self, changeset_modified):
+        """Test that each change is yielded as a (table, change_type) tuple."""
+        changes = list(stream_changes(changeset_modified))
+
+        assert len(changes) == 6
+        assert all(table == "cities" for table, _ in changes)
+        assert sorted(change_type for _, change_type in changes) == ["delete"] * 2 + ["insert"] * 2 + ["update"] * 2
+
+    @pytest.mark.fast
+    def test_stream_changes_is_lazy(self):
+        """Test that the changeset is not opened until iteration starts."""
+        changes = stream_changes("/nonexistent/changeset.diff")
+
+        with pytest.raises(GeoDiffError, match=_FAILED_LIST):
+            next(changes)
 
 
 # Tests for error handling
@@ -373,303 +479,164 @@ class TestListChangesJson:
 class TestErrorHandling:
     """Tests for error handling in various functions."""
 
+    @pytest.mark.fast
     def test_has_changes_invalid_path(self):
         """Test has_changes with invalid path returns False."""
         result = has_changes("/nonexistent/changeset.diff")
         assert result is False
 
+    @pytest.mark.fast
     def test_count_changes_invalid_path(self):
         """Test count_changes with invalid path returns 0."""
         result = count_changes("/nonexistent/changeset.diff")
         assert result == 0
 
-    def test_create_changeset_incompatible_schemas(self, temp_dir):
+    @pytest.mark.integration
+    def test_create_changeset_incompatible_schemas(self, incompatible_gpkg_pair):
         """Test creating changeset between files with incompatible schemas raises error."""
-        # Create two GeoPackages with different schemas
-        import sqlite3
-
-        gpkg1 = temp_dir / "schema1.gpkg"
-        gpkg2 = temp_dir / "schema2.gpkg"
-
-        # Create first GeoPackage with one schema
-        conn1 = sqlite3.connect(str(gpkg1))
-        conn1.executescript("""
-            CREATE TABLE gpkg_spatial_ref_sys (srs_name TEXT, srs_id INTEGER PRIMARY KEY, organization TEXT, organization_coordsys_id INTEGER, definition TEXT, description TEXT);
-            CREATE TABLE gpkg_contents (table_name TEXT PRIMARY KEY, data_type TEXT, identifier TEXT, description TEXT, last_change DATETIME, min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE, srs_id INTEGER);
-            CREATE TABLE gpkg_geometry_columns (table_name TEXT, column_name TEXT, geometry_type_name TEXT, srs_id INTEGER, z TINYINT, m TINYINT, PRIMARY KEY (table_name, column_name));
-            INSERT INTO gpkg_spatial_ref_sys VALUES ('WGS 84', 4326, 'EPSG', 4326, 'GEOGCS["WGS 84"]', NULL);
-            CREATE TABLE layer_a (fid INTEGER PRIMARY KEY, geom BLOB, name TEXT);
-            INSERT INTO gpkg_contents VALUES ('layer_a', 'features', 'layer_a', '', datetime('now'), NULL, NULL, NULL, NULL, 4326);
-            INSERT INTO gpkg_geometry_columns VALUES ('layer_a', 'geom', 'POINT', 4326, 0, 0);
-        """)
-        conn1.close()
-
-        # Create second GeoPackage with different schema
-        conn2 = sqlite3.connect(str(gpkg2))
-        conn2.executescript("""
-            CREATE TABLE gpkg_spatial_ref_sys (srs_name TEXT, srs_id INTEGER PRIMARY KEY, organization TEXT, organization_coordsys_id INTEGER, definition TEXT, description TEXT);
-            CREATE TABLE gpkg_contents (table_name TEXT PRIMARY KEY, data_type TEXT, identifier TEXT, description TEXT, last_change DATETIME, min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE, srs_id INTEGER);
-            CREATE TABLE gpkg_geometry_columns (table_name TEXT, column_name TEXT, geometry_type_name TEXT, srs_id INTEGER, z TINYINT, m TINYINT, PRIMARY KEY (table_name, column_name));
-            INSERT INTO gpkg_spatial_ref_sys VALUES ('WGS 84', 4326, 'EPSG', 4326, 'GEOGCS["WGS 84"]', NULL);
-            CREATE TABLE layer_b (fid INTEGER PRIMARY KEY, geom BLOB, description TEXT, value REAL);
-            INSERT INTO gpkg_contents VALUES ('layer_b', 'features', 'layer_b', '', datetime('now'), NULL, NULL, NULL, NULL, 4326);
-            INSERT INTO gpkg_geometry_columns VALUES ('layer_b', 'geom', 'POINT', 4326, 0, 0);
-        """)
-        conn2.close()
+        gpkg1, gpkg2 = incompatible_gpkg_pair
 
         # pygeodiff raises error for incompatible schemas - verify our error handling
-        with pytest.raises(GeoDiffError, match="Failed to create changeset"):
+        with pytest.raises(GeoDiffError, match=_FAILED_CHANGESET):
             compute_diff(str(gpkg1), str(gpkg2))
 
 
 # Tests for parsing change types
 
 
-class TestParseChangeTypes:
-    """Tests for verifying change type parsing in compute_diff."""
-
-    def test_parse_insert_type(self):
-        """Test parsing insert change type from geodiff output."""
-        # Simulate geodiff output with insert
-        changes_detail = {
-            "geodiff": [
-                {
-                    "table": "test_layer",
-                    "changes": [
-                        {"type": "insert", "values": {}},
-                        {"type": "insert", "values": {}},
-                    ],
-                }
-            ]
-        }
-
-        # Count inserts manually (simulating what compute_diff does)
-        insert_count = 0
-        for table_changes in changes_detail.get("geodiff", []):
-            for change in table_changes.get("changes", []):
-                if change.get("type") == "insert":
-                    insert_count += 1
-
-        assert insert_count == 2
-
-    def test_parse_update_type(self):
-        """Test parsing update change type from geodiff output."""
-        changes_detail = {
-            "geodiff": [
-                {
-                    "table": "test_layer",
-                    "changes": [
-                        {"type": "update", "values": {}},
-                    ],
-                }
-            ]
-        }
-
-        update_count = 0
-        for table_changes in changes_detail.get("geodiff", []):
-            for change in table_changes.get("changes", []):
-                if change.get("type") == "update":
-                    update_count += 1
-
-        assert update_count == 1
+def _count_ops(changes_detail: dict) -> Counter:
+    """Count change types across all tables of a list_changes_json-style result."""
+    return Counter(
+        change.get("type") for table in changes_detail.get("geodiff", []) for change in table.get("changes", [])
+    )
 
-    def test_parse_delete_type(self):
-        """Test parsing delete change type from geodiff output."""
-        changes_detail = {
-            "geodiff": [
-                {
-                    "table": "test_layer",
-                    "changes": [
-                        {"type": "delete", "values": {}},
-                        {"type": "delete", "values": {}},
-                        {"type": "delete", "values": {}},
-                    ],
-                }
-            ]
-        }
 
-        delete_count = 0
-        for table_changes in changes_detail.get("geodiff", []):
-            for change in table_changes.get("changes", []):
-                if change.get("type") == "delete":
-                    delete_count += 1
-
-        assert delete_count == 3
-
-    def test_parse_mixed_types(self):
-        """Test parsing mixed change types."""
-        changes_detail = {
-            "geodiff": [
-                {
-                    "table": "layer1",
-                    "changes": [
-                        {"type": "insert"},
-                        {"type": "update"},
-                    ],
-                },
-                {
-                    "table": "layer2",
-                    "changes": [
-                        {"type": "delete"},
-                        {"type": "insert"},
-                    ],
-                },
-            ]
-        }
+@pytest.mark.fast
+class TestParseChangeTypes:
+    """Tests for verifying change type parsing in compute_diff."""
 
-        insert_count = 0
-        update_count = 0
-        delete_count = 0
-
-        for table_changes in changes_detail.get("geodiff", []):
-            for change in table_changes.get("changes", []):
-                op = change.get("type", "")
-                if op == "insert":
-                    insert_count += 1
-                elif op == "update":
-                    update_count += 1
-                elif op == "delete":
-                    delete_count += 1
-
-        assert insert_count == 2
-        assert update_count == 1
-        assert delete_count == 1
-
-    def test_parse_unknown_type(self):
-        """Test that unknown change types are ignored."""
+    @pytest.mark.parametrize(
+        ("changes", "expected"),
+        [
+            pytest.param(
+                [("test_layer", ["insert", "insert"])],
+                {"insert": 2, "update": 0, "delete": 0},
+                id="insert",
+            ),
+            pytest.param(
+                [("test_layer", ["update"])],
+                {"insert": 0, "update": 1, "delete": 0},
+                id="update",
+            ),
+            pytest.param(
+                [("test_layer", ["delete", "delete", "delete"])],
+                {"insert": 0, "update": 0, "delete": 3},
+                id="delete",
+            ),
+            pytest.param(
+                [("layer1", ["insert", "update"]), ("layer2", ["delete", "insert"])],
+                {"insert": 2, "update": 1, "delete": 1},
+                id="mixed",
+            ),
+            # Unknown change types are ignored
+            pytest.param(
+                [("test_layer", ["unknown_operation", "insert"])],
+                {"insert": 1, "update": 0, "delete": 0},
+                id="unknown",
+            ),
+        ],
+    )
+    def test_parse_change_types(self, changes, expected):
+        """Test counting change types from geodiff output."""
         changes_detail = {
             "geodiff": [
-                {
-                    "table": "test_layer",
-                    "changes": [
-                        {"type": "unknown_operation"},
-                        {"type": "insert"},
-                    ],
-                }
+                {"table": table, "changes": [{"type": op, "values": {}} for op in ops]} for table, ops in changes
             ]
         }
 
-        insert_count = 0
-        update_count = 0
-        delete_count = 0
+        counts = _count_ops(changes_detail)
 
-        for table_changes in changes_detail.get("geodiff", []):
-            for change in table_changes.get("changes", []):
-                op = change.get("type", "")
-                if op == "insert":
-                    insert_count += 1
-                elif op == "update":
-                    update_count += 1
-                elif op == "delete":
-                    delete_count += 1
-
-        # Only insert should be counted
-        assert insert_count == 1
-        assert update_count == 0
-        assert delete_count == 0
+        assert {op: counts[op] for op in expected} == expected
 
 
 # Tests for change type counting with Italian cities data
 
 
+@pytest.mark.integration
 class TestChangeTypeCounting:
     """Tests for verifying change type counting in compute_diff with Italian cities."""
 
-    def test_count_inserts_only(self, empty_gpkg, base_gpkg):
-        """Test that inserts are counted correctly (5 Italian cities)."""
-        result = compute_diff(empty_gpkg, base_gpkg)
+    @pytest.mark.parametrize(
+        ("diff_fixture", "expected"),
+        [
+            # Empty to populated: all 5 cities (Roma, Milano, Napoli, Torino, Firenze) are inserts
+            pytest.param(
+                "diff_empty_base",
+                {"total_changes": 5, "inserts": 5, "updates": 0, "deletes": 0},
+                id="inserts_only",
+            ),
+            # Populated to empty: all 5 cities are deletes
+            pytest.param(
+                "diff_base_empty",
+                {"total_changes": 5, "inserts": 0, "updates": 0, "deletes": 5},
+                id="deletes_only",
+            ),
+            # Base to modified: Bologna and Venezia added, Roma and Torino updated,
+            # Napoli and Firenze deleted
+            pytest.param(
+                "diff_base_modified",
+                {"total_changes": 6, "inserts": 2, "updates": 2, "deletes": 2},
+                id="mixed",
+            ),
+        ],
+    )
+    def test_count_change_types(self, request, diff_fixture, expected):
+        """Test that each change type is counted correctly with Italian cities."""
+        result = request.getfixturevalue(diff_fixture)
 
-        # When going from empty to populated, all should be inserts
         assert result["has_changes"] is True
         summary = result["summary"]
-        # Exactly 5 cities: Roma, Milano, Napoli, Torino, Firenze
-        assert summary["total_changes"] == 5
-        assert summary["inserts"] == 5
-        assert summary["updates"] == 0
-        assert summary["deletes"] == 0
-
-    def test_count_deletes_only(self, base_gpkg, empty_gpkg):
-        """Test that deletes are counted correctly (5 Italian cities)."""
-        result = compute_diff(base_gpkg, empty_gpkg)
+        for key, value in expected.items():
+            assert summary[key] == value, f"Expected {value} {key}, got {summary[key]}"
 
-        # When going from populated to empty, all should be deletes
-        assert result["has_changes"] is True
-        summary = result["summary"]
-        # Exactly 5 cities deleted
-        assert summary["total_changes"] == 5
-        assert summary["inserts"] == 0
-        assert summary["updates"] == 0
-        assert summary["deletes"] == 5
+    def test_compute_diff_with_mocked_changes(self, minimal_gpkg_pair):
+        """Test compute_diff with mocked pygeodiff returning specific change types."""
+        gpkg1, gpkg2 = minimal_gpkg_pair
 
-    def test_count_mixed_changes(self, base_gpkg, modified_gpkg):
-        """Test counting mixed changes with Italian cities.
+        # Mock the changeset reader to return specific change types
+        def make_entry(operation):
+            return SimpleNamespace(table=SimpleNamespace(name="test_layer"), operation=operation)
 
-        Base cities: Roma, Milano, Napoli, Torino, Firenze (5 cities)
-        Modified: Roma*, Milano, Torino*, Bologna+, Venezia+ (5 cities)
-        * = updated, + = new
+        mock_entries = [
+            make_entry(pygeodiff.ChangesetEntry.OP_INSERT),
+            make_entry(pygeodiff.ChangesetEntry.OP_INSERT),
+            make_entry(pygeodiff.ChangesetEntry.OP_UPDATE),
+            make_entry(pygeodiff.ChangesetEntry.OP_DELETE),
+        ]
 
-        Expected changes:
-        - Inserts: 2 (Bologna, Venezia)
-        - Updates: 2 (Roma, Torino)
-        - Deletes: 2 (Napoli, Firenze)
-        """
-        result = compute_diff(base_gpkg, modified_gpkg)
+        with patch.object(_get_geodiff(), "read_changeset", return_value=iter(mock_entries)):
+            result = compute_diff(str(gpkg1), str(gpkg2))
 
         assert result["has_changes"] is True
-        summary = result["summary"]
-
-        # Verify expected changes
-        assert summary["inserts"] == 2, f"Expected 2 inserts (Bologna, Venezia), got {summary['inserts']}"
-        assert summary["updates"] == 2, f"Expected 2 updates (Roma, Torino), got {summary['updates']}"
-        assert summary["deletes"] == 2, f"Expected 2 deletes (Napoli, Firenze), got {summary['deletes']}"
-        assert summary["total_changes"] == 6, f"Expected 6 total changes, got {summary['total_changes']}"
-
-    def test_compute_diff_with_mocked_changes(self, temp_dir):
-        """Test compute_diff with mocked pygeodiff returning specific change types."""
-        import sqlite3
-
-        # Create two identical GeoPackages
-        gpkg1 = temp_dir / "base_mock.gpkg"
-        gpkg2 = temp_dir / "compare_mock.gpkg"
-
-        for gpkg in [gpkg1, gpkg2]:
-            conn = sqlite3.connect(str(gpkg))
-            conn.executescript("""
-                CREATE TABLE gpkg_spatial_ref_sys (srs_name TEXT, srs_id INTEGER PRIMARY KEY, organization TEXT, organization_coordsys_id INTEGER, definition TEXT, description TEXT);
-                CREATE TABLE gpkg_contents (table_name TEXT PRIMARY KEY, data_type TEXT, identifier TEXT, description TEXT, last_change DATETIME, min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE, srs_id INTEGER);
-                CREATE TABLE gpkg_geometry_columns (table_name TEXT, column_name TEXT, geometry_type_name TEXT, srs_id INTEGER, z TINYINT, m TINYINT, PRIMARY KEY (table_name, column_name));
-                INSERT INTO gpkg_spatial_ref_sys VALUES ('WGS 84', 4326, 'EPSG', 4326, 'GEOGCS["WGS 84"]', NULL);
-                CREATE TABLE test_layer (fid INTEGER PRIMARY KEY, geom BLOB, name TEXT);
-                INSERT INTO gpkg_contents VALUES ('test_layer', 'features', 'test_layer', '', datetime('now'), NULL, NULL, NULL, NULL, 4326);
-                INSERT INTO gpkg_geometry_columns VALUES ('test_layer', 'geom', 'POINT', 4326, 0, 0);
-                INSERT INTO test_layer (fid, name) VALUES (1, 'Point A');
-            """)
-            conn.close()
-
-        # Mock list_changes_json to return specific change types
-        mock_changes = {
-            "geodiff": [
-                {
-                    "table": "test_layer",
-                    "changes": [
-                        {"type": "insert"},
-                        {"type": "insert"},
-                        {"type": "update"},
-                        {"type": "delete"},
-                    ],
-                }
-            ]
-        }
-
-        with patch("geodiff.list_changes_json", return_value=mock_changes):
-            with patch("geodiff.has_changes", return_value=True):
-                with patch("geodiff.count_changes", return_value=4):
-                    result = compute_diff(str(gpkg1), str(gpkg2))
-
+        assert result["summary"]["total_changes"] == 4
         assert result["summary"]["inserts"] == 2
         assert result["summary"]["updates"] == 1
         assert result["summary"]["deletes"] == 1
 
+    def test_compute_diff_skips_unknown_operations(self, base_gpkg, identical_gpkg):
+        """Test that unknown changeset operations are ignored."""
+        entries = [
+            SimpleNamespace(table=SimpleNamespace(name="cities"), operation=pygeodiff.ChangesetEntry.OP_INSERT),
+            SimpleNamespace(table=SimpleNamespace(name="cities"), operation=-1),
+        ]
+
+        with patch.object(_get_geodiff(), "read_changeset", return_value=iter(entries)):
+            result = compute_diff(base_gpkg, identical_gpkg)
+
+        assert result["summary"]["total_changes"] == 1
+        assert result["summary"]["inserts"] == 1
+        assert result["changes"]["geodiff"] == [{"table": "cities", "changes": [{"type": "insert"}]}]
+
 
 # Tests for format_output with table details
 
@@ -677,19 +644,19 @@ class TestChangeTypeCounting:
 class TestFormatOutputTableDetails:
     """Tests for format_output with table details in summary."""
 
-    def test_summary_includes_tables_affected(self, base_gpkg, modified_gpkg):
+    @pytest.mark.integration
+    def test_summary_includes_tables_affected(self, diff_base_modified):
         """Test that summary includes tables affected section."""
-        result = compute_diff(base_gpkg, modified_gpkg)
+        result = diff_base_modified
         output = format_output(result, "summary")
 
         # If there are changes, tables affected should be shown
         if result["has_changes"] and result["changes"].get("geodiff"):
             assert "Tables affected:" in output
 
-    def test_summary_shows_table_names(self, base_gpkg, modified_gpkg):
+    @pytest.mark.fast
+    def test_summary_shows_table_names(self):
         """Test that summary shows individual table names."""
-        _ = compute_diff(base_gpkg, modified_gpkg)
-
         # Manually construct a result with known table data
         result_with_tables = {
             "base_file": "base.gpkg",
@@ -719,12 +686,13 @@ class TestFormatOutputTableDetails:
 # Tests for verifying specific changeset details with Italian cities
 
 
+@pytest.mark.integration
 class TestItalianCitiesChangesets:
     """Tests verifying exact changeset details with Italian cities data."""
 
-    def test_changeset_contains_cities_table(self, base_gpkg, modified_gpkg):
+    def test_changeset_contains_cities_table(self, diff_base_modified):
         """Test that changeset includes the 'cities' table."""
-        result = compute_diff(base_gpkg, modified_gpkg)
+        result = diff_base_modified
 
         changes = result["changes"]
         assert "geodiff" in changes
@@ -740,39 +708,29 @@ class TestItalianCitiesChangesets:
         assert cities_table is not None, "Expected 'cities' table in changeset"
         assert "changes" in cities_table
 
-    def test_changeset_detail_inserts(self, empty_gpkg, base_gpkg):
+    def test_changeset_detail_inserts(self, diff_empty_base):
         """Test that inserting 5 Italian cities produces correct changeset."""
-        result = compute_diff(empty_gpkg, base_gpkg)
+        result = diff_empty_base
 
         changes = result["changes"]["geodiff"]
         assert len(changes) > 0
 
         # All changes should be inserts
-        total_inserts = 0
-        for table_change in changes:
-            for change in table_change.get("changes", []):
-                assert change.get("type") == "insert", f"Expected insert, got {change.get('type')}"
-                total_inserts += 1
-
-        assert total_inserts == 5, f"Expected 5 inserts, got {total_inserts}"
+        counts = _count_ops(result["changes"])
+        assert counts == {"insert": 5}, f"Expected 5 inserts only, got {dict(counts)}"
 
-    def test_changeset_detail_deletes(self, base_gpkg, empty_gpkg):
+    def test_changeset_detail_deletes(self, diff_base_empty):
         """Test that deleting 5 Italian cities produces correct changeset."""
-        result = compute_diff(base_gpkg, empty_gpkg)
+        result = diff_base_empty
 
         changes = result["changes"]["geodiff"]
         assert len(changes) > 0
 
         # All changes should be deletes
-        total_deletes = 0
-        for table_change in changes:
-            for change in table_change.get("changes", []):
-                assert change.get("type") == "delete", f"Expected delete, got {change.get('type')}"
-                total_deletes += 1
+        counts = _count_ops(result["changes"])
+        assert counts == {"delete": 5}, f"Expected 5 deletes only, got {dict(counts)}"
 
-        assert total_deletes == 5, f"Expected 5 deletes, got {total_deletes}"
-
-    def test_changeset_detail_mixed_changes(self, base_gpkg, modified_gpkg):
+    def test_changeset_detail_mixed_changes(self, diff_base_modified):
         """Test that mixed changes produce correct changeset types.
 
         Expected:
@@ -780,29 +738,17 @@ class TestItalianCitiesChangesets:
         - 2 updates (Roma, Torino)
         - 2 deletes (Napoli, Firenze)
         """
-        result = compute_diff(base_gpkg, modified_gpkg)
+        result = diff_base_modified
 
         changes = result["changes"]["geodiff"]
         assert len(changes) > 0
 
         # Count change types
-        inserts = 0
-        updates = 0
-        deletes = 0
-
-        for table_change in changes:
-            for change in table_change.get("changes", []):
-                change_type = change.get("type")
-                if change_type == "insert":
-                    inserts += 1
-                elif change_type == "update":
-                    updates += 1
-                elif change_type == "delete":
-                    deletes += 1
-
-        assert inserts == 2, f"Expected 2 inserts, got {inserts}"
-        assert updates == 2, f"Expected 2 updates, got {updates}"
-        assert deletes == 2, f"Expected 2 deletes, got {deletes}"
+        counts = _count_ops(result["changes"])
+
+        assert counts["insert"] == 2, f"Expected 2 inserts, got {counts['insert']}"
+        assert counts["update"] == 2, f"Expected 2 updates, got {counts['update']}"
+        assert counts["delete"] == 2, f"Expected 2 deletes, got {counts['delete']}"
 
     def test_single_city_insert(self, empty_gpkg, single_feature_gpkg):
         """Test inserting a single city (Roma) produces exactly 1 insert."""
@@ -828,13 +774,13 @@ class TestItalianCitiesChangesets:
 # Integration tests
 
 
+@pytest.mark.integration
 class TestIntegration:
     """Integration tests for the full diff workflow with Italian cities."""
 
-    def test_full_workflow(self, base_gpkg, modified_gpkg):
+    def test_full_workflow(self, diff_base_modified):
         """Test the complete diff workflow with Italian cities."""
-        # Compute diff
-        result = compute_diff(base_gpkg, modified_gpkg)
+        result = diff_base_modified
 
         # Verify result
         assert result["has_changes"] is True
@@ -849,12 +795,12 @@ class TestIntegration:
 
         # Format as summary
         summary_output = format_output(result, "summary")
-        assert "GeoDiff Summary" in summary_output
-        assert "cities:" in summary_output  # Should show the cities table
+        assert summary_output.startswith("GeoDiff Summary")
+        assert _CITIES_RE.search(summary_output) is not None  # Should show the cities table
 
-    def test_roundtrip_identical(self, base_gpkg, identical_gpkg):
+    def test_roundtrip_identical(self, diff_identical):
         """Test that identical Italian cities produce empty diff."""
-        result = compute_diff(base_gpkg, identical_gpkg)
+        result = diff_identical
 
         assert result["has_changes"] is False
         assert result["summary"]["total_changes"] == 0
@@ -862,44 +808,11 @@ class TestIntegration:
         assert result["summary"]["updates"] == 0
         assert result["summary"]["deletes"] == 0
 
-    def test_sqlite_extension_support(self, temp_dir):
-        """Test that .sqlite extension is supported."""
-        import sqlite3
-
-        sqlite_file = temp_dir / "test.sqlite"
-
-        conn = sqlite3.connect(str(sqlite_file))
-        conn.executescript("""
-            CREATE TABLE gpkg_spatial_ref_sys (srs_name TEXT, srs_id INTEGER PRIMARY KEY, organization TEXT, organization_coordsys_id INTEGER, definition TEXT, description TEXT);
-            CREATE TABLE gpkg_contents (table_name TEXT PRIMARY KEY, data_type TEXT, identifier TEXT, description TEXT, last_change DATETIME, min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE, srs_id INTEGER);
-            CREATE TABLE gpkg_geometry_columns (table_name TEXT, column_name TEXT, geometry_type_name TEXT, srs_id INTEGER, z TINYINT, m TINYINT, PRIMARY KEY (table_name, column_name));
-            INSERT INTO gpkg_spatial_ref_sys VALUES ('WGS 84', 4326, 'EPSG', 4326, 'GEOGCS["WGS 84"]', NULL);
-            CREATE TABLE data (fid INTEGER PRIMARY KEY, name TEXT);
-            INSERT INTO gpkg_contents VALUES ('data', 'features', 'data', '', datetime('now'), NULL, NULL, NULL, NULL, 4326);
-        """)
-        conn.close()
-
-        # Should validate without error
-        path = validate_file(str(sqlite_file))
-        assert path.suffix == ".sqlite"
-
-    def test_db_extension_support(self, temp_dir):
-        """Test that .db extension is supported."""
-        import sqlite3
-
-        db_file = temp_dir / "test.db"
-
-        conn = sqlite3.connect(str(db_file))
-        conn.executescript("""
-            CREATE TABLE gpkg_spatial_ref_sys (srs_name TEXT, srs_id INTEGER PRIMARY KEY, organization TEXT, organization_coordsys_id INTEGER, definition TEXT, description TEXT);
-            CREATE TABLE gpkg_contents (table_name TEXT PRIMARY KEY, data_type TEXT, identifier TEXT, description TEXT, last_change DATETIME, min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE, srs_id INTEGER);
-            CREATE TABLE gpkg_geometry_columns (table_name TEXT, column_name TEXT, geometry_type_name TEXT, srs_id INTEGER, z TINYINT, m TINYINT, PRIMARY KEY (table_name, column_name));
-            INSERT INTO gpkg_spatial_ref_sys VALUES ('WGS 84', 4326, 'EPSG', 4326, 'GEOGCS["WGS 84"]', NULL);
-            CREATE TABLE data (fid INTEGER PRIMARY KEY, name TEXT);
-            INSERT INTO gpkg_contents VALUES ('data', 'features', 'data', '', datetime('now'), NULL, NULL, NULL, NULL, 4326);
-        """)
-        conn.close()
+    @pytest.mark.parametrize("suffix", [".sqlite", ".db"])
+    def test_extension_support(self, _gpkg_skeleton, tmp_path, suffix):
+        """Test that .sqlite and .db extensions are supported."""
+        dest = tmp_path / f"test{suffix}"
+        shutil.copyfile(_gpkg_skeleton, dest)
 
         # Should validate without error
-        path = validate_file(str(db_file))
-        assert path.suffix == ".db"
+        assert validate_file(str(dest)).suffix == suffix
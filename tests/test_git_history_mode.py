@@ -5,16 +5,11 @@ compares the current version with the previous git commit version.
 """
 
 import subprocess
+from collections import Counter
 from pathlib import Path
 
 import pytest
 
-import sys
-
-sys.path.insert(0, "src")
-sys.path.insert(0, "tests")
-
-from conftest import ITALIAN_CITIES_BASE, ITALIAN_CITIES_MODIFIED, create_geopackage
 from geodiff import compute_diff
 from git_utils import (
     GitError,
@@ -23,6 +18,10 @@ from git_utils import (
     has_file_in_commit,
     is_git_repo,
 )
+from tests.conftest import ITALIAN_CITIES_BASE, ITALIAN_CITIES_MODIFIED, create_geopackage
+
+
+pytestmark = pytest.mark.integration
 
 
 @pytest.fixture
@@ -68,7 +67,7 @@ def git_repo_with_gpkg(tmp_path):
     # Create initial GeoPackage with 5 Italian cities and commit
     gpkg_path = data_dir / "cities.gpkg"
     create_geopackage(
-        str(gpkg_path),
+        gpkg_path,
         table_name="cities",
         features=ITALIAN_CITIES_BASE,
         description="Italian cities dataset - Initial",
@@ -85,7 +84,7 @@ def git_repo_with_gpkg(tmp_path):
     # Modify the GeoPackage (update, delete, insert) and commit
     gpkg_path.unlink()  # Remove old file
     create_geopackage(
-        str(gpkg_path),
+        gpkg_path,
         table_name="cities",
         features=ITALIAN_CITIES_MODIFIED,
         description="Italian cities dataset - Modified",
@@ -147,7 +146,7 @@ def git_repo_with_new_gpkg(tmp_path):
     data_dir.mkdir()
     gpkg_path = data_dir / "new_cities.gpkg"
     create_geopackage(
-        str(gpkg_path),
+        gpkg_path,
         table_name="cities",
         features=ITALIAN_CITIES_BASE,
         description="Italian cities dataset - New file",
@@ -277,19 +276,10 @@ class TestGitHistoryModeChangesets:
 
             # Count change types from changeset
             changes = result["changes"]["geodiff"]
-            inserts = 0
-            updates = 0
-            deletes = 0
-
-            for table_change in changes:
-                for change in table_change.get("changes", []):
-                    change_type = change.get("type")
-                    if change_type == "insert":
-                        inserts += 1
-                    elif change_type == "update":
-                        updates += 1
-                    elif change_type == "delete":
-                        deletes += 1
+            counts = Counter(
+                change.get("type") for table_change in changes for change in table_change.get("changes", ())
+            )
+            inserts, updates, deletes = counts["insert"], counts["update"], counts["delete"]
 
             # Verify counts match expected
             assert inserts == 2, f"Expected 2 inserts (Bologna, Venezia), got {inserts}"
@@ -326,7 +316,7 @@ class TestGitHistoryModeEdgeCases:
         # Create GeoPackage and commit
         gpkg_path = repo_dir / "data.gpkg"
         create_geopackage(
-            str(gpkg_path),
+            gpkg_path,
             table_name="cities",
             features=ITALIAN_CITIES_BASE,
         )
@@ -387,7 +377,7 @@ class TestGitHistoryModeEdgeCases:
         )
 
         gpkg_path = repo_dir / "data.gpkg"
-        create_geopackage(str(gpkg_path), table_name="cities", features=ITALIAN_CITIES_BASE)
+        create_geopackage(gpkg_path, table_name="cities", features=ITALIAN_CITIES_BASE)
 
         subprocess.run(["git", "add", "."], cwd=repo_dir, capture_output=True, check=True)
         subprocess.run(
@@ -5,10 +5,6 @@ from pathlib import Path
 
 import pytest
 
-import sys
-
-sys.path.insert(0, "src")
-
 from git_utils import (
     GitError,
     find_repo_root,
@@ -19,6 +15,9 @@ from git_utils import (
 )
 
 
+pytestmark = pytest.mark.integration
+
+
 @pytest.fixture
 def git_repo(tmp_path):
     """Create a temporary git repository with some commits."""